@@ -5,6 +5,9 @@
 using Pkg
 Pkg.activate(".")
 
+# Load environment utilities
+include(joinpath(dirname(@__DIR__), "src", "utils", "env_utils.jl"))
+
 println("🔧 DataMind Neo4j Setup Helper")
 println("=" ^ 40)
 
@@ -38,7 +41,14 @@ REDIS_URL=redis://localhost:6379
 LOG_LEVEL=INFO
 """
         
-        write(env_path, env_template)
+        # Write to a sibling temp file and rename so an interrupted run never leaves a partial .env
+        tmp_path = "$(env_path).tmp"
+        try
+            write(tmp_path, env_template)
+            mv(tmp_path, env_path; force=true)
+        finally
+            isfile(tmp_path) && rm(tmp_path, force=true)
+        end
         println("✅ Created .env template at $env_path")
         println("📝 Please edit the file and add your actual credentials")
         return false
@@ -48,23 +58,6 @@ LOG_LEVEL=INFO
     end
 end
 
-function load_env_vars()
-    env_vars = Dict{String, String}()
-    
-    if isfile(".env")
-        for line in readlines(".env")
-            line = strip(line)
-            if !isempty(line) && !startswith(line, "#") && contains(line, "=")
-                key, value = split(line, "=", limit=2)
-                env_vars[strip(key)] = strip(value)
-                ENV[strip(key)] = strip(value)
-            end
-        end
-    end
-    
-    return env_vars
-end
-
 function check_neo4j_config(env_vars)
     println("\n🗃️  Checking Neo4j Configuration")
     println("-" ^ 30)
@@ -74,7 +67,7 @@ function check_neo4j_config(env_vars)
     
     for key in required_keys
         value = get(env_vars, key, "")
-        if isempty(value) || contains(value, "your_") || contains(value, "_here")
+        if isempty(value) || (key == "NEO4J_PASSWORD" && value in NEO4J_PASSWORD_PLACEHOLDERS)
             push!(missing_keys, key)
             println("❌ $key: not configured")
         else
@@ -22,10 +22,12 @@ mutable struct KnowledgeGraph
         
         if neo4j_kg !== nothing
             try
+                # Fail fast on an unreachable server before issuing the schema statements
+                verify_connectivity(neo4j_kg)
                 initialize_schema(neo4j_kg)
                 @info "Using Neo4j knowledge graph backend"
             catch e
-                @warn "Failed to initialize Neo4j, falling back to in-memory storage" error=e
+                @warn "Failed to initialize Neo4j, falling back to in-memory storage" category=neo4j_error_category(e) error=e
                 neo4j_kg = nothing
             end
         else
@@ -233,13 +235,13 @@ function query_similar_experiments(kg::KnowledgeGraph, current_experiment::Exper
     
     # Simple text similarity on research questions
     current_question = lowercase(current_experiment.research_question)
+    current_words = Set(split(current_question))
     
     for (exp_id, exp_data) in kg.experiments
         if exp_id != current_experiment.id
             other_question = lowercase(exp_data["research_question"])
             
             # Simple keyword overlap
-            current_words = Set(split(current_question))
             other_words = Set(split(other_question))
             overlap = length(intersect(current_words, other_words))
             
@@ -272,13 +274,20 @@ function query_insights(kg::KnowledgeGraph, research_question::String)
     # Try Neo4j backend for advanced insights
     if kg.neo4j_backend !== nothing
         try
-            insights["similar_experiments"] = query_similar_experiments(kg.neo4j_backend, research_question)
-            insights["statistics"] = get_experiment_statistics(kg.neo4j_backend)
-            insights["successful_patterns"] = query_successful_patterns(kg.neo4j_backend)
+            # The three queries are independent HTTP round-trips, so issue them concurrently;
+            # @sync waits for all of them even when one fails
+            @sync begin
+                @async insights["similar_experiments"] = query_similar_experiments(kg.neo4j_backend, research_question)
+                @async insights["statistics"] = get_experiment_statistics(kg.neo4j_backend)
+                @async insights["successful_patterns"] = query_successful_patterns(kg.neo4j_backend)
+            end
             @debug "Retrieved insights from Neo4j"
             return insights
         catch e
-            @warn "Failed to query Neo4j insights, falling back to in-memory" error=e
+            # @sync wraps task failures in CompositeException/TaskFailedException; log the Neo4j error itself
+            cause = e isa CompositeException ? first(e.exceptions) : e
+            cause = cause isa TaskFailedException ? cause.task.exception : cause
+            @warn "Failed to query Neo4j insights, falling back to in-memory" error=cause
         end
     end
     
@@ -296,10 +305,10 @@ In-memory implementation of similar experiments query
 """
 function query_similar_experiments_memory(kg::KnowledgeGraph, research_question::String)
     similar = []
-    query_words = Set(split(lowercase(research_question), r"\\s+"))
+    query_words = Set(split(lowercase(research_question)))
     
     for (exp_id, exp_data) in kg.experiments
-        exp_words = Set(split(lowercase(exp_data["research_question"]), r"\\s+"))
+        exp_words = Set(split(lowercase(exp_data["research_question"])))
         overlap = length(intersect(query_words, exp_words))
         
         if overlap > 0
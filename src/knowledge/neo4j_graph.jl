@@ -9,25 +9,100 @@ using HTTP, JSON3
 import Dates
 import Base64: base64encode
 
+# Fail fast when the server is down rather than waiting on HTTP.jl's default connect timeout
+const NEO4J_DEFAULT_CONNECT_TIMEOUT = 2
+# HTTP.jl never times out reads by default; bound a server that accepts but stops responding
+const NEO4J_DEFAULT_READ_TIMEOUT = 60
+
 struct Neo4jKnowledgeGraph
     uri::String
     user::String
     password::String
+    endpoint::String
+    headers::Vector{Pair{String, String}}
+    connect_timeout::Int
+    read_timeout::Int
+    
+    function Neo4jKnowledgeGraph(uri::String, user::String, password::String; connect_timeout::Int=NEO4J_DEFAULT_CONNECT_TIMEOUT, read_timeout::Int=NEO4J_DEFAULT_READ_TIMEOUT)
+        # Build the transaction endpoint and auth headers once so every query
+        # reuses them (and HTTP.jl's pooled connection) instead of rebuilding per call
+        http_uri = neo4j_http_uri(uri)
+        if !endswith(http_uri, "/")
+            http_uri *= "/"
+        end
+        endpoint = http_uri * "db/neo4j/tx/commit"
+        
+        headers = [
+            "Authorization" => "Basic " * base64encode("$(user):$(password)"),
+            "Content-Type" => "application/json",
+            "Accept" => "application/json"
+        ]
+        
+        new(uri, user, password, endpoint, headers, connect_timeout, read_timeout)
+    end
+end
+
+# HTTP API scheme for each Neo4j driver URI scheme (+s / +ssc variants use TLS)
+const NEO4J_HTTP_SCHEMES = Dict(
+    "bolt" => "http",
+    "neo4j" => "http",
+    "bolt+s" => "https",
+    "neo4j+s" => "https",
+    "bolt+ssc" => "https",
+    "neo4j+ssc" => "https"
+)
+
+"""
+Convert a Neo4j URI to the base URL of its HTTP API
+
+Driver schemes (bolt, neo4j and their +s/+ssc TLS variants) map to http/https, and the
+default Bolt port 7687 maps to the default HTTP(S) port. IPv6 hosts keep their brackets.
+http(s) URIs are returned unchanged.
+"""
+function neo4j_http_uri(uri::AbstractString)
+    parts = HTTP.URI(uri)
+    scheme = lowercase(parts.scheme)
+    
+    if scheme in ("http", "https")
+        return String(uri)
+    end
+    
+    http_scheme = get(NEO4J_HTTP_SCHEMES, scheme, nothing)
+    if http_scheme === nothing
+        throw(ArgumentError("Unsupported Neo4j URI scheme: $(parts.scheme)"))
+    end
+    
+    # Convert bolt://localhost:7687 to http://localhost:7474 (https on 7473)
+    default_port = http_scheme == "https" ? "7473" : "7474"
+    port = (isempty(parts.port) || parts.port == "7687") ? default_port : parts.port
+    host = contains(parts.host, ":") && !startswith(parts.host, "[") ? "[$(parts.host)]" : parts.host
     
-    function Neo4jKnowledgeGraph(uri::String, user::String, password::String)
-        new(uri, user, password)
+    return "$(http_scheme)://$(host):$(port)$(parts.path)"
+end
+
+"""
+Read a positive whole number from environment variable `name`, returning `default`
+when it is unset and warning before returning `default` when it is invalid
+"""
+function env_positive_int(name::String, default::Int)
+    haskey(ENV, name) || return default
+    value = tryparse(Int, ENV[name])
+    if value === nothing || value <= 0
+        @warn "$name must be a positive whole number, using default of $default" value=ENV[name]
+        return default
     end
+    return value
 end
 
 """
 Create Neo4j knowledge graph from environment variables
 """
 function create_neo4j_knowledge_graph()
-    # Convert bolt URI to HTTP URI if needed
-    uri = get(ENV, "NEO4J_URI", "bolt://localhost:7687")
-    if startswith(uri, "bolt://")
-        # Convert bolt://localhost:7687 to http://localhost:7474
-        uri = replace(uri, "bolt://" => "http://", ":7687" => ":7474")
+    uri = try
+        neo4j_http_uri(get(ENV, "NEO4J_URI", "bolt://localhost:7687"))
+    catch e
+        @warn "Invalid NEO4J_URI, falling back to in-memory knowledge graph" error=e
+        return nothing
     end
     
     user = get(ENV, "NEO4J_USER", "neo4j")
@@ -38,129 +113,166 @@ function create_neo4j_knowledge_graph()
         return nothing
     end
     
-    return Neo4jKnowledgeGraph(uri, user, password)
+    # A template placeholder can never authenticate; skip the doomed login attempt
+    if password in NEO4J_PASSWORD_PLACEHOLDERS
+        @warn "NEO4J_PASSWORD is still a template placeholder, falling back to in-memory knowledge graph"
+        return nothing
+    end
+    
+    connect_timeout = env_positive_int("NEO4J_CONNECT_TIMEOUT", NEO4J_DEFAULT_CONNECT_TIMEOUT)
+    read_timeout = env_positive_int("NEO4J_READ_TIMEOUT", NEO4J_DEFAULT_READ_TIMEOUT)
+    
+    return Neo4jKnowledgeGraph(uri, user, password; connect_timeout=connect_timeout, read_timeout=read_timeout)
+end
+
+"""
+Raised when Neo4j accepts a request but reports Cypher errors in the response payload
+"""
+struct Neo4jQueryError <: Exception
+    message::String
 end
 
+Base.showerror(io::IO, e::Neo4jQueryError) = print(io, "Neo4j query failed: ", e.message)
+
 """
 Execute a Cypher query via Neo4j HTTP API
 """
 function execute_cypher(kg::Neo4jKnowledgeGraph, query::String, parameters::Dict{String, Any}=Dict{String, Any}())
-    # Convert bolt:// to http:// for HTTP API
-    http_uri = replace(kg.uri, "bolt://" => "http://")
-    if !endswith(http_uri, "/")
-        http_uri *= "/"
-    end
-    endpoint = http_uri * "db/neo4j/tx/commit"
-    
-    # Prepare request
-    auth_header = "Basic " * base64encode("$(kg.user):$(kg.password)")
-    headers = [
-        "Authorization" => auth_header,
-        "Content-Type" => "application/json",
-        "Accept" => "application/json"
-    ]
-    
+    return execute_cypher_batch(kg, [query => parameters])
+end
+
+"""
+Execute several Cypher statements in a single Neo4j HTTP API transaction.
+Statements run in order and commit together, costing one round-trip instead of one per statement.
+"""
+function execute_cypher_batch(kg::Neo4jKnowledgeGraph, statements::Vector{Pair{String, Dict{String, Any}}})
     body = JSON3.write(Dict(
         "statements" => [Dict(
             "statement" => query,
             "parameters" => parameters
-        )]
+        ) for (query, parameters) in statements]
     ))
     
     try
-        response = HTTP.post(endpoint, headers, body)
+        response = HTTP.post(kg.endpoint, kg.headers, body; connect_timeout=kg.connect_timeout, readtimeout=kg.read_timeout)
         result = JSON3.read(String(response.body))
         
         if haskey(result, "errors") && !isempty(result.errors)
             error_msg = join([err.message for err in result.errors], "; ")
-            throw(ArgumentError("Neo4j query failed: $error_msg"))
+            throw(Neo4jQueryError(error_msg))
         end
         
         return result
     catch e
-        @error "Failed to execute Neo4j query" query=query error=e
-        throw(e)
+        @error "Failed to execute Neo4j query" category=neo4j_error_category(e) query=join(first.(statements), "\n") error=e
+        rethrow()
     end
 end
 
+"""
+Classify a Neo4j request failure by exception type so callers can report an actionable cause.
+"""
+neo4j_error_category(e) = "unexpected error"
+neo4j_error_category(::HTTP.Exceptions.ConnectError) = "server unreachable"
+neo4j_error_category(::HTTP.Exceptions.TimeoutError) = "request timed out"
+neo4j_error_category(e::HTTP.Exceptions.StatusError) = e.status == 401 ? "bad credentials" : "HTTP error $(e.status)"
+neo4j_error_category(::Neo4jQueryError) = "query error"
+
+# Categories that affect every subsequent request, unlike per-statement query errors
+const NEO4J_FATAL_ERROR_CATEGORIES = ("bad credentials", "server unreachable", "request timed out")
+
+"""
+Issue a trivial query to confirm the server is reachable and the credentials are accepted.
+Also opens the pooled HTTP connection that subsequent queries reuse.
+"""
+function verify_connectivity(kg::Neo4jKnowledgeGraph)
+    execute_cypher(kg, "RETURN 1")
+    return true
+end
+
+# Constraints and indexes for all node types, built once at load time
+const NEO4J_SCHEMA_QUERIES = [
+    # Core experiment constraints
+    "CREATE CONSTRAINT datamind_experiment_id IF NOT EXISTS FOR (e:DataMindExperiment) REQUIRE e.id IS UNIQUE",
+    "CREATE CONSTRAINT datamind_iteration_id IF NOT EXISTS FOR (i:DataMindIteration) REQUIRE (i.experiment_id, i.iteration) IS UNIQUE",
+    
+    # Knowledge artifact constraints
+    "CREATE CONSTRAINT datamind_pattern_id IF NOT EXISTS FOR (p:CodePattern) REQUIRE p.id IS UNIQUE",
+    "CREATE CONSTRAINT datamind_technique_name IF NOT EXISTS FOR (t:Technique) REQUIRE t.name IS UNIQUE",
+    "CREATE CONSTRAINT datamind_domain_name IF NOT EXISTS FOR (d:Domain) REQUIRE d.name IS UNIQUE",
+    
+    # Cognitive & Learning Intelligence constraints
+    "CREATE CONSTRAINT agent_name IF NOT EXISTS FOR (a:Agent) REQUIRE a.name IS UNIQUE",
+    "CREATE CONSTRAINT strategy_id IF NOT EXISTS FOR (s:Strategy) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT decision_rule_id IF NOT EXISTS FOR (dr:DecisionRule) REQUIRE dr.id IS UNIQUE",
+    "CREATE CONSTRAINT learning_pattern_id IF NOT EXISTS FOR (lp:LearningPattern) REQUIRE lp.id IS UNIQUE",
+    "CREATE CONSTRAINT knowledge_state_id IF NOT EXISTS FOR (ks:KnowledgeState) REQUIRE ks.id IS UNIQUE",
+    
+    # Temporal & Contextual Intelligence constraints
+    "CREATE CONSTRAINT time_context_id IF NOT EXISTS FOR (tc:TimeContext) REQUIRE tc.id IS UNIQUE",
+    "CREATE CONSTRAINT experiment_context_id IF NOT EXISTS FOR (ec:ExperimentContext) REQUIRE ec.id IS UNIQUE",
+    "CREATE CONSTRAINT environment_snapshot_id IF NOT EXISTS FOR (es:EnvironmentSnapshot) REQUIRE es.id IS UNIQUE",
+    
+    # Causal & Explanatory Intelligence constraints
+    "CREATE CONSTRAINT causal_factor_id IF NOT EXISTS FOR (cf:CausalFactor) REQUIRE cf.id IS UNIQUE",
+    "CREATE CONSTRAINT explanation_id IF NOT EXISTS FOR (e:Explanation) REQUIRE e.id IS UNIQUE",
+    "CREATE CONSTRAINT assumption_id IF NOT EXISTS FOR (a:Assumption) REQUIRE a.id IS UNIQUE",
+    
+    # Risk & Reliability Intelligence constraints
+    "CREATE CONSTRAINT risk_factor_id IF NOT EXISTS FOR (rf:RiskFactor) REQUIRE rf.id IS UNIQUE",
+    "CREATE CONSTRAINT failure_mode_id IF NOT EXISTS FOR (fm:FailureMode) REQUIRE fm.id IS UNIQUE",
+    "CREATE CONSTRAINT validation_rule_id IF NOT EXISTS FOR (vr:ValidationRule) REQUIRE vr.id IS UNIQUE",
+    
+    # Data & Feature Intelligence constraints
+    "CREATE CONSTRAINT data_source_id IF NOT EXISTS FOR (ds:DataSource) REQUIRE ds.id IS UNIQUE",
+    "CREATE CONSTRAINT feature_transform_id IF NOT EXISTS FOR (ft:FeatureTransform) REQUIRE ft.id IS UNIQUE",
+    "CREATE CONSTRAINT feature_interaction_id IF NOT EXISTS FOR (fi:FeatureInteraction) REQUIRE fi.id IS UNIQUE",
+    
+    # Ensemble Methods Intelligence constraints
+    "CREATE CONSTRAINT ensemble_method_id IF NOT EXISTS FOR (em:EnsembleMethod) REQUIRE em.id IS UNIQUE",
+    "CREATE CONSTRAINT base_model_id IF NOT EXISTS FOR (bm:BaseModel) REQUIRE bm.id IS UNIQUE",
+    "CREATE CONSTRAINT meta_learner_id IF NOT EXISTS FOR (ml:MetaLearner) REQUIRE ml.id IS UNIQUE",
+    "CREATE CONSTRAINT stacking_level_id IF NOT EXISTS FOR (sl:StackingLevel) REQUIRE sl.id IS UNIQUE",
+    "CREATE CONSTRAINT bootstrap_strategy_id IF NOT EXISTS FOR (bs:BootstrapStrategy) REQUIRE bs.id IS UNIQUE",
+    "CREATE CONSTRAINT boosting_sequence_id IF NOT EXISTS FOR (bs:BoostingSequence) REQUIRE bs.id IS UNIQUE",
+    "CREATE CONSTRAINT weak_learner_id IF NOT EXISTS FOR (wl:WeakLearner) REQUIRE wl.id IS UNIQUE",
+    "CREATE CONSTRAINT bayesian_prior_id IF NOT EXISTS FOR (bp:BayesianPrior) REQUIRE bp.id IS UNIQUE",
+    "CREATE CONSTRAINT model_posterior_id IF NOT EXISTS FOR (mp:ModelPosterior) REQUIRE mp.id IS UNIQUE",
+    "CREATE CONSTRAINT nonparametric_process_id IF NOT EXISTS FOR (np:NonparametricProcess) REQUIRE np.id IS UNIQUE",
+    
+    # Performance indexes
+    "CREATE INDEX datamind_experiment_question IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.research_question)",
+    "CREATE INDEX datamind_iteration_success IF NOT EXISTS FOR (i:DataMindIteration) ON (i.success)",
+    "CREATE INDEX datamind_experiment_created IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.created_at)",
+    "CREATE INDEX datamind_experiment_domain IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.domain_tags)",
+    "CREATE INDEX datamind_technique_category IF NOT EXISTS FOR (t:Technique) ON (t.category)",
+    "CREATE INDEX datamind_pattern_category IF NOT EXISTS FOR (p:CodePattern) ON (p.category)",
+    
+    # Advanced intelligence indexes for performance optimization
+    "CREATE INDEX agent_expertise IF NOT EXISTS FOR (a:Agent) ON (a.expertise_level)",
+    "CREATE INDEX strategy_success_rate IF NOT EXISTS FOR (s:Strategy) ON (s.success_rate)",
+    "CREATE INDEX risk_probability IF NOT EXISTS FOR (rf:RiskFactor) ON (rf.probability)",
+    "CREATE INDEX ensemble_performance IF NOT EXISTS FOR (em:EnsembleMethod) ON (em.performance_improvement)",
+    "CREATE INDEX base_model_contribution IF NOT EXISTS FOR (bm:BaseModel) ON (bm.ensemble_contribution)",
+    "CREATE INDEX time_context_period IF NOT EXISTS FOR (tc:TimeContext) ON (tc.period)",
+    "CREATE INDEX experiment_context_resources IF NOT EXISTS FOR (ec:ExperimentContext) ON (ec.computing_resources)",
+    "CREATE INDEX failure_mode_severity IF NOT EXISTS FOR (fm:FailureMode) ON (fm.severity)",
+    "CREATE INDEX causal_factor_strength IF NOT EXISTS FOR (cf:CausalFactor) ON (cf.strength)"
+]
+
 """
 Initialize the knowledge graph schema with comprehensive advanced ontology including ensemble intelligence
 """
 function initialize_schema(kg::Neo4jKnowledgeGraph)
-    # Create constraints and indexes for all node types
-    schema_queries = [
-        # Core experiment constraints
-        "CREATE CONSTRAINT datamind_experiment_id IF NOT EXISTS FOR (e:DataMindExperiment) REQUIRE e.id IS UNIQUE",
-        "CREATE CONSTRAINT datamind_iteration_id IF NOT EXISTS FOR (i:DataMindIteration) REQUIRE (i.experiment_id, i.iteration) IS UNIQUE",
-        
-        # Knowledge artifact constraints
-        "CREATE CONSTRAINT datamind_pattern_id IF NOT EXISTS FOR (p:CodePattern) REQUIRE p.id IS UNIQUE",
-        "CREATE CONSTRAINT datamind_technique_name IF NOT EXISTS FOR (t:Technique) REQUIRE t.name IS UNIQUE",
-        "CREATE CONSTRAINT datamind_domain_name IF NOT EXISTS FOR (d:Domain) REQUIRE d.name IS UNIQUE",
-        
-        # Cognitive & Learning Intelligence constraints
-        "CREATE CONSTRAINT agent_name IF NOT EXISTS FOR (a:Agent) REQUIRE a.name IS UNIQUE",
-        "CREATE CONSTRAINT strategy_id IF NOT EXISTS FOR (s:Strategy) REQUIRE s.id IS UNIQUE",
-        "CREATE CONSTRAINT decision_rule_id IF NOT EXISTS FOR (dr:DecisionRule) REQUIRE dr.id IS UNIQUE",
-        "CREATE CONSTRAINT learning_pattern_id IF NOT EXISTS FOR (lp:LearningPattern) REQUIRE lp.id IS UNIQUE",
-        "CREATE CONSTRAINT knowledge_state_id IF NOT EXISTS FOR (ks:KnowledgeState) REQUIRE ks.id IS UNIQUE",
-        
-        # Temporal & Contextual Intelligence constraints
-        "CREATE CONSTRAINT time_context_id IF NOT EXISTS FOR (tc:TimeContext) REQUIRE tc.id IS UNIQUE",
-        "CREATE CONSTRAINT experiment_context_id IF NOT EXISTS FOR (ec:ExperimentContext) REQUIRE ec.id IS UNIQUE",
-        "CREATE CONSTRAINT environment_snapshot_id IF NOT EXISTS FOR (es:EnvironmentSnapshot) REQUIRE es.id IS UNIQUE",
-        
-        # Causal & Explanatory Intelligence constraints
-        "CREATE CONSTRAINT causal_factor_id IF NOT EXISTS FOR (cf:CausalFactor) REQUIRE cf.id IS UNIQUE",
-        "CREATE CONSTRAINT explanation_id IF NOT EXISTS FOR (e:Explanation) REQUIRE e.id IS UNIQUE",
-        "CREATE CONSTRAINT assumption_id IF NOT EXISTS FOR (a:Assumption) REQUIRE a.id IS UNIQUE",
-        
-        # Risk & Reliability Intelligence constraints
-        "CREATE CONSTRAINT risk_factor_id IF NOT EXISTS FOR (rf:RiskFactor) REQUIRE rf.id IS UNIQUE",
-        "CREATE CONSTRAINT failure_mode_id IF NOT EXISTS FOR (fm:FailureMode) REQUIRE fm.id IS UNIQUE",
-        "CREATE CONSTRAINT validation_rule_id IF NOT EXISTS FOR (vr:ValidationRule) REQUIRE vr.id IS UNIQUE",
-        
-        # Data & Feature Intelligence constraints
-        "CREATE CONSTRAINT data_source_id IF NOT EXISTS FOR (ds:DataSource) REQUIRE ds.id IS UNIQUE",
-        "CREATE CONSTRAINT feature_transform_id IF NOT EXISTS FOR (ft:FeatureTransform) REQUIRE ft.id IS UNIQUE",
-        "CREATE CONSTRAINT feature_interaction_id IF NOT EXISTS FOR (fi:FeatureInteraction) REQUIRE fi.id IS UNIQUE",
-        
-        # Ensemble Methods Intelligence constraints
-        "CREATE CONSTRAINT ensemble_method_id IF NOT EXISTS FOR (em:EnsembleMethod) REQUIRE em.id IS UNIQUE",
-        "CREATE CONSTRAINT base_model_id IF NOT EXISTS FOR (bm:BaseModel) REQUIRE bm.id IS UNIQUE",
-        "CREATE CONSTRAINT meta_learner_id IF NOT EXISTS FOR (ml:MetaLearner) REQUIRE ml.id IS UNIQUE",
-        "CREATE CONSTRAINT stacking_level_id IF NOT EXISTS FOR (sl:StackingLevel) REQUIRE sl.id IS UNIQUE",
-        "CREATE CONSTRAINT bootstrap_strategy_id IF NOT EXISTS FOR (bs:BootstrapStrategy) REQUIRE bs.id IS UNIQUE",
-        "CREATE CONSTRAINT boosting_sequence_id IF NOT EXISTS FOR (bs:BoostingSequence) REQUIRE bs.id IS UNIQUE",
-        "CREATE CONSTRAINT weak_learner_id IF NOT EXISTS FOR (wl:WeakLearner) REQUIRE wl.id IS UNIQUE",
-        "CREATE CONSTRAINT bayesian_prior_id IF NOT EXISTS FOR (bp:BayesianPrior) REQUIRE bp.id IS UNIQUE",
-        "CREATE CONSTRAINT model_posterior_id IF NOT EXISTS FOR (mp:ModelPosterior) REQUIRE mp.id IS UNIQUE",
-        "CREATE CONSTRAINT nonparametric_process_id IF NOT EXISTS FOR (np:NonparametricProcess) REQUIRE np.id IS UNIQUE",
-        
-        # Performance indexes
-        "CREATE INDEX datamind_experiment_question IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.research_question)",
-        "CREATE INDEX datamind_iteration_success IF NOT EXISTS FOR (i:DataMindIteration) ON (i.success)",
-        "CREATE INDEX datamind_experiment_created IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.created_at)",
-        "CREATE INDEX datamind_experiment_domain IF NOT EXISTS FOR (e:DataMindExperiment) ON (e.domain_tags)",
-        "CREATE INDEX datamind_technique_category IF NOT EXISTS FOR (t:Technique) ON (t.category)",
-        "CREATE INDEX datamind_pattern_category IF NOT EXISTS FOR (p:CodePattern) ON (p.category)",
-        
-        # Advanced intelligence indexes for performance optimization
-        "CREATE INDEX agent_expertise IF NOT EXISTS FOR (a:Agent) ON (a.expertise_level)",
-        "CREATE INDEX strategy_success_rate IF NOT EXISTS FOR (s:Strategy) ON (s.success_rate)",
-        "CREATE INDEX risk_probability IF NOT EXISTS FOR (rf:RiskFactor) ON (rf.probability)",
-        "CREATE INDEX ensemble_performance IF NOT EXISTS FOR (em:EnsembleMethod) ON (em.performance_improvement)",
-        "CREATE INDEX base_model_contribution IF NOT EXISTS FOR (bm:BaseModel) ON (bm.ensemble_contribution)",
-        "CREATE INDEX time_context_period IF NOT EXISTS FOR (tc:TimeContext) ON (tc.period)",
-        "CREATE INDEX experiment_context_resources IF NOT EXISTS FOR (ec:ExperimentContext) ON (ec.computing_resources)",
-        "CREATE INDEX failure_mode_severity IF NOT EXISTS FOR (fm:FailureMode) ON (fm.severity)",
-        "CREATE INDEX causal_factor_strength IF NOT EXISTS FOR (cf:CausalFactor) ON (cf.strength)"
-    ]
-    
-    for query in schema_queries
+    for query in NEO4J_SCHEMA_QUERIES
         try
             execute_cypher(kg, query)
         catch e
+            # The server going away, stalling or rejecting credentials mid-setup fails every
+            # remaining statement; stop instead of waiting out each one
+            if neo4j_error_category(e) in NEO4J_FATAL_ERROR_CATEGORIES
+                rethrow()
+            end
             @warn "Schema query may have failed (this is often ok for existing constraints)" query=query error=e
         end
     end
@@ -187,7 +299,6 @@ function update_knowledge(kg::Neo4jKnowledgeGraph, experiment::Experiment, resul
         exp.status = \$status,
         exp.domain_tags = \$domain_tags,
         exp.complexity_score = \$complexity_score
-    RETURN exp.id as id
     """
     
     experiment_params = Dict{String, Any}(
@@ -199,8 +310,6 @@ function update_knowledge(kg::Neo4jKnowledgeGraph, experiment::Experiment, resul
         "complexity_score" => estimate_complexity(experiment.research_question)
     )
     
-    execute_cypher(kg, experiment_query, experiment_params)
-    
     # Create iteration node with enhanced metadata
     iteration_query = """
     MATCH (exp:DataMindExperiment {id: \$experiment_id})
@@ -215,7 +324,6 @@ function update_knowledge(kg::Neo4jKnowledgeGraph, experiment::Experiment, resul
         iter.techniques_used = \$techniques_used,
         iter.timestamp = datetime()
     MERGE (exp)-[:HAS_ITERATION]->(iter)
-    RETURN iter.iteration as iteration
     """
     
     iteration_params = Dict{String, Any}(
@@ -231,16 +339,23 @@ function update_knowledge(kg::Neo4jKnowledgeGraph, experiment::Experiment, resul
         "techniques_used" => JSON3.write(techniques)
     )
     
-    execute_cypher(kg, iteration_query, iteration_params)
+    # Experiment and iteration writes commit together in one round-trip
+    execute_cypher_batch(kg, [
+        experiment_query => experiment_params,
+        iteration_query => iteration_params
+    ])
     
     # Extract and create ensemble intelligence
     ensemble_info = extract_ensemble_intelligence(result.code_generated, result.evaluation_summary)
     create_ensemble_relationships(kg, experiment.id, iteration, ensemble_info)
     
-    # Create cognitive intelligence for learning agents
-    create_cognitive_intelligence(kg, "planning_agent", "domain_analysis", result.success)
-    create_cognitive_intelligence(kg, "code_generation_agent", "pattern_matching", result.success)
-    create_cognitive_intelligence(kg, "evaluation_agent", "performance_assessment", result.success)
+    # Create cognitive intelligence for learning agents; each agent touches its own
+    # Agent/Strategy nodes, so the three writes can run concurrently
+    @sync begin
+        @async create_cognitive_intelligence(kg, "planning_agent", "domain_analysis", result.success)
+        @async create_cognitive_intelligence(kg, "code_generation_agent", "pattern_matching", result.success)
+        @async create_cognitive_intelligence(kg, "evaluation_agent", "performance_assessment", result.success)
+    end
     
     # Create domain nodes and relationships
     create_domain_relationships(kg, experiment.id, domain_tags)
@@ -263,7 +378,7 @@ Query similar experiments based on research question similarity
 function query_similar_experiments(kg::Neo4jKnowledgeGraph, research_question::String, limit::Int=5)
     query = """
     MATCH (exp:DataMindExperiment)-[:HAS_ITERATION]->(iter:DataMindIteration)
-    WHERE exp.research_question CONTAINS \$keyword OR \$keyword CONTAINS exp.research_question
+    WHERE toLower(exp.research_question) CONTAINS \$keyword OR \$keyword CONTAINS toLower(exp.research_question)
     WITH exp, iter, 
          size(split(toLower(exp.research_question), ' ')) as exp_words,
          size(split(toLower(\$keyword), ' ')) as query_words
@@ -271,15 +386,14 @@ function query_similar_experiments(kg::Neo4jKnowledgeGraph, research_question::S
     RETURN DISTINCT exp.id as experiment_id,
            exp.research_question as question,
            exp.created_at as created_at,
-           collect(iter.metrics) as all_metrics,
            count(iter) as successful_iterations
     ORDER BY successful_iterations DESC, exp.created_at DESC
     LIMIT \$limit
     """
     
-    # Extract keywords from research question
-    keywords = split(lowercase(research_question), r"\\s+")
-    main_keyword = join(keywords[1:min(3, length(keywords))], " ")
+    # Extract keywords from research question, stopping after the first three
+    keywords = Iterators.take(eachsplit(lowercase(research_question)), 3)
+    main_keyword = join(keywords, " ")
     
     params = Dict{String, Any}(
         "keyword" => main_keyword,
@@ -297,7 +411,7 @@ function query_similar_experiments(kg::Neo4jKnowledgeGraph, research_question::S
                         "experiment_id" => row.row[1],
                         "question" => row.row[2],
                         "created_at" => row.row[3],
-                        "successful_iterations" => row.row[5]
+                        "successful_iterations" => row.row[4]
                     ))
                 end
             end
@@ -387,30 +501,30 @@ end
 
 # Helper functions for enhanced knowledge extraction
 
+# Domain keyword mapping
+const NEO4J_DOMAIN_KEYWORDS = Dict(
+    "correlation" => ["correlation", "correlate", "relationship", "association"],
+    "regression" => ["regression", "predict", "prediction", "linear", "polynomial"],
+    "classification" => ["classification", "classify", "category", "class"],
+    "clustering" => ["clustering", "cluster", "group", "segment"],
+    "time_series" => ["time", "temporal", "series", "trend", "seasonal"],
+    "nlp" => ["text", "language", "sentiment", "topic", "nlp"],
+    "computer_vision" => ["image", "vision", "visual", "picture", "cv"],
+    "statistics" => ["statistical", "hypothesis", "test", "significance"],
+    "machine_learning" => ["model", "training", "learning", "algorithm", "ml"],
+    "data_preprocessing" => ["clean", "preprocess", "transform", "normalize"],
+    "feature_engineering" => ["feature", "engineering", "selection", "extraction"],
+    "visualization" => ["plot", "chart", "graph", "visualize", "display"]
+)
+
 """
 Extract domain tags from research question text
 """
 function extract_domain_tags(research_question::String)
     question_lower = lowercase(research_question)
     
-    # Domain keyword mapping
-    domain_keywords = Dict(
-        "correlation" => ["correlation", "correlate", "relationship", "association"],
-        "regression" => ["regression", "predict", "prediction", "linear", "polynomial"],
-        "classification" => ["classification", "classify", "category", "class"],
-        "clustering" => ["clustering", "cluster", "group", "segment"],
-        "time_series" => ["time", "temporal", "series", "trend", "seasonal"],
-        "nlp" => ["text", "language", "sentiment", "topic", "nlp"],
-        "computer_vision" => ["image", "vision", "visual", "picture", "cv"],
-        "statistics" => ["statistical", "hypothesis", "test", "significance"],
-        "machine_learning" => ["model", "training", "learning", "algorithm", "ml"],
-        "data_preprocessing" => ["clean", "preprocess", "transform", "normalize"],
-        "feature_engineering" => ["feature", "engineering", "selection", "extraction"],
-        "visualization" => ["plot", "chart", "graph", "visualize", "display"]
-    )
-    
     detected_domains = String[]
-    for (domain, keywords) in domain_keywords
+    for (domain, keywords) in NEO4J_DOMAIN_KEYWORDS
         if any(keyword -> contains(question_lower, keyword), keywords)
             push!(detected_domains, domain)
         end
@@ -419,31 +533,31 @@ function extract_domain_tags(research_question::String)
     return isempty(detected_domains) ? ["general"] : detected_domains
 end
 
+# Technique patterns
+const NEO4J_TECHNIQUE_PATTERNS = Dict(
+    "pearson_correlation" => ["cor(", "pearson", "correlation"],
+    "spearman_correlation" => ["spearman", "rank correlation"],
+    "linear_regression" => ["lm(", "linear", "regression"],
+    "logistic_regression" => ["glm(", "logistic"],
+    "random_forest" => ["randomforest", "random forest"],
+    "svm" => ["svm", "support vector"],
+    "k_means" => ["kmeans", "k-means"],
+    "pca" => ["pca", "principal component"],
+    "t_test" => ["t.test", "t-test", "ttest"],
+    "chi_square" => ["chisq", "chi-square", "chi square"],
+    "outlier_detection" => ["outlier", "anomaly", "remove_outliers"],
+    "normalization" => ["normalize", "scale", "standardize"],
+    "cross_validation" => ["cv", "cross-validation", "crossval"]
+)
+
 """
 Extract techniques used from code and evaluation summary
 """
 function extract_techniques(code_generated::String, evaluation_summary::String)
     text = lowercase(code_generated * " " * evaluation_summary)
     
-    # Technique patterns
-    technique_patterns = Dict(
-        "pearson_correlation" => ["cor(", "pearson", "correlation"],
-        "spearman_correlation" => ["spearman", "rank correlation"],
-        "linear_regression" => ["lm(", "linear", "regression"],
-        "logistic_regression" => ["glm(", "logistic"],
-        "random_forest" => ["randomforest", "random forest"],
-        "svm" => ["svm", "support vector"],
-        "k_means" => ["kmeans", "k-means"],
-        "pca" => ["pca", "principal component"],
-        "t_test" => ["t.test", "t-test", "ttest"],
-        "chi_square" => ["chisq", "chi-square", "chi square"],
-        "outlier_detection" => ["outlier", "anomaly", "remove_outliers"],
-        "normalization" => ["normalize", "scale", "standardize"],
-        "cross_validation" => ["cv", "cross-validation", "crossval"]
-    )
-    
     detected_techniques = String[]
-    for (technique, patterns) in technique_patterns
+    for (technique, patterns) in NEO4J_TECHNIQUE_PATTERNS
         if any(pattern -> contains(text, pattern), patterns)
             push!(detected_techniques, technique)
         end
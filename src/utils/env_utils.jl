@@ -4,6 +4,9 @@ Environment Utilities
 Centralized utilities for loading environment variables from .env files.
 """
 
+# NEO4J_PASSWORD values written by the .env templates (setup_neo4j.jl, docs)
+const NEO4J_PASSWORD_PLACEHOLDERS = ("your_neo4j_password_here", "your_password_here")
+
 """
     load_env_file(filepath=".env")
 
@@ -20,11 +23,23 @@ load_env_file("config/.env")  # Load from specific path
 ```
 """
 function load_env_file(filepath=".env")
+    load_env_vars(filepath)
+    return nothing
+end
+
+"""
+Internal helper behind `load_env_file` that also returns the parsed key/value pairs.
+Not exported: the Dict holds secrets (NEO4J_PASSWORD, API keys) that a REPL would echo.
+"""
+function load_env_vars(filepath=".env")
+    env_vars = Dict{String, String}()
+    
     if isfile(filepath)
         for line in readlines(filepath)
             line = strip(line)
             if !isempty(line) && !startswith(line, "#") && contains(line, "=")
                 key, value = split(line, "=", limit=2)
+                env_vars[strip(key)] = strip(value)
                 ENV[strip(key)] = strip(value)
             end
         end
@@ -32,6 +47,8 @@ function load_env_file(filepath=".env")
     else
         @warn "⚠️  No .env file found at $filepath - using system environment variables"
     end
+    
+    return env_vars
 end
 
 export load_env_file
\ No newline at end of file
@@ -45,23 +45,45 @@ println()
     @testset "Discovered Test Scripts" begin
         println("🔄 Running all discovered test scripts...")
         
-        # Run each test file as a subprocess to avoid module conflicts
-        for test_file in sort(all_test_files)
+        # Each script pays its own Julia startup and DataMind load, so allow several
+        # to run side by side
+        test_jobs = max(1, something(tryparse(Int, get(ENV, "DATAMIND_TEST_JOBS", "1")), 1))
+        println("⚙️  Running with $test_jobs parallel job(s)")
+        
+        # Run each test file as a subprocess to avoid module conflicts. Output is captured
+        # and printed as each script finishes, so parallel scripts never interleave
+        report_lock = ReentrantLock()
+        script_results = asyncmap(sort(all_test_files); ntasks=test_jobs) do test_file
+            # Use joinpath to ensure correct path
+            test_path = joinpath(test_dir, test_file)
+            output = IOBuffer()
+            exitcode, failure = try
+                result = run(pipeline(`julia --project=. $test_path`; stdout=output, stderr=output))
+                (result.exitcode, nothing)
+            catch e
+                (nothing, e)
+            end
+            
+            lock(report_lock) do
+                println("🧪 Finished: $test_file")
+                print(String(take!(output)))
+                if failure === nothing
+                    println("✅ $test_file passed")
+                else
+                    @warn "❌ $test_file failed" error=failure
+                end
+            end
+            return (test_file, exitcode, failure)
+        end
+        
+        for (test_file, exitcode, failure) in script_results
             test_name = replace(test_file, ".jl" => "", "_" => " ")
             test_name = titlecase(test_name)
             
             @testset "$test_name" begin
-                println("🧪 Running: $test_file")
-                
-                # Use joinpath to ensure correct path
-                test_path = joinpath(test_dir, test_file)
-                
-                try
-                    result = run(`julia --project=. $test_path`)
-                    @test result.exitcode == 0
-                    println("✅ $test_file passed")
-                catch e
-                    @warn "❌ $test_file failed" error=e
+                if failure === nothing
+                    @test exitcode == 0
+                else
                     # Don't fail the entire test suite for individual test failures
                     # This allows us to see which tests pass/fail
                     @test_broken false
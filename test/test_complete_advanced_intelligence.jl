@@ -11,14 +11,12 @@ script_dir = dirname(@__FILE__)
 project_root = dirname(script_dir)
 cd(project_root)
 
-# Load environment utilities
-include("../src/utils/env_utils.jl")
-load_env_file()
-
+# DataMind loads the project .env on module initialization
 include(joinpath(project_root, "src", "DataMind.jl"))
 using .DataMind
 
-# Import internal Neo4j functions for direct testing
+# Import internal Neo4j functions (and the env constants they use) for direct testing
+include(joinpath(project_root, "src", "utils", "env_utils.jl"))
 include(joinpath(project_root, "src", "knowledge", "neo4j_graph.jl"))
 
 println("🎪 COMPLETE ADVANCED INTELLIGENCE TEST - INCLUDING ENSEMBLE METHODS")
@@ -68,6 +68,17 @@ function test_fallback_behavior()
             end
         end
         
+        # Test 4: Similar experiments match on shared words regardless of case
+        println("\n📝 Test 4: Querying similar experiments from in-memory backend...")
+        similar = query_insights(kg, "IN-MEMORY Fallback check")["similar_experiments"]
+        
+        if any(exp -> exp["experiment_id"] == experiment.id, similar)
+            println("✅ Found similar experiment: $(experiment.research_question)")
+        else
+            println("❌ Expected \"$(experiment.research_question)\" among similar experiments")
+            return false
+        end
+        
         println("\n🎉 Fallback behavior test PASSED!")
         return true
         
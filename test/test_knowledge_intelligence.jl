@@ -11,10 +11,7 @@ script_dir = dirname(@__FILE__)
 project_root = dirname(script_dir)
 cd(project_root)
 
-# Load environment utilities
-include("../src/utils/env_utils.jl")
-load_env_file()
-
+# DataMind loads the project .env on module initialization
 include(joinpath(project_root, "src", "DataMind.jl"))
 using .DataMind
 
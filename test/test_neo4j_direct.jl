@@ -47,54 +47,69 @@ function test_direct_neo4j_queries()
     println("👤 User: $user")
     
     try
+        # All four read queries go out as statements of a single transaction,
+        # so the whole report costs one HTTP round-trip
+        
         # Query 1: Count all DataMind nodes
-        println("\n📊 Query 1: Counting DataMind experiments...")
         query1 = """
         MATCH (e:DataMindExperiment)
         RETURN count(e) as experiment_count
         """
         
-        body1 = JSON3.write(Dict(
+        # Query 2: List recent experiments
+        query2 = """
+        MATCH (e:DataMindExperiment)
+        RETURN e.id, e.research_question, e.created_at, e.status
+        ORDER BY e.created_at DESC
+        LIMIT 5
+        """
+        
+        # Query 3: Count iterations and success rate
+        query3 = """
+        MATCH (i:DataMindIteration)
+        RETURN 
+            count(i) as total_iterations,
+            sum(case when i.success then 1 else 0 end) as successful_iterations,
+            avg(case when i.success then 1.0 else 0.0 end) as success_rate
+        """
+        
+        # Query 4: Most common metrics (stored as JSON strings, so keys are counted client-side)
+        query4 = """
+        MATCH (i:DataMindIteration)
+        WHERE i.metrics IS NOT NULL
+        RETURN i.metrics
+        """
+        
+        body = JSON3.write(Dict(
             "statements" => [Dict(
-                "statement" => query1,
+                "statement" => query,
                 "parameters" => Dict()
-            )]
+            ) for query in (query1, query2, query3, query4)]
         ))
         
-        response1 = HTTP.post(endpoint, headers, body1)
-        result1 = JSON3.read(String(response1.body))
+        response = HTTP.post(endpoint, headers, body)
+        result = JSON3.read(String(response.body))
+        
+        # A failing statement stops the transaction, so later results may be missing
+        results = haskey(result, "results") ? result["results"] : []
+        not_run = "⚠️  Not run: an earlier statement in the transaction failed"
         
-        if haskey(result1, "results") && !isempty(result1["results"])
-            data = result1["results"][1]["data"]
+        println("\n📊 Query 1: Counting DataMind experiments...")
+        if length(results) >= 1
+            data = results[1]["data"]
             if !isempty(data)
                 count = data[1]["row"][1]
                 println("✅ Found $count DataMind experiments in database")
             else
                 println("📭 No experiments found in database")
             end
+        else
+            println(not_run)
         end
         
-        # Query 2: List recent experiments
         println("\n📊 Query 2: Recent experiments...")
-        query2 = """
-        MATCH (e:DataMindExperiment)
-        RETURN e.id, e.research_question, e.created_at, e.status
-        ORDER BY e.created_at DESC
-        LIMIT 5
-        """
-        
-        body2 = JSON3.write(Dict(
-            "statements" => [Dict(
-                "statement" => query2,
-                "parameters" => Dict()
-            )]
-        ))
-        
-        response2 = HTTP.post(endpoint, headers, body2)
-        result2 = JSON3.read(String(response2.body))
-        
-        if haskey(result2, "results") && !isempty(result2["results"])
-            data = result2["results"][1]["data"]
+        if length(results) >= 2
+            data = results[2]["data"]
             if !isempty(data)
                 println("📝 Recent experiments:")
                 for row in data
@@ -104,30 +119,13 @@ function test_direct_neo4j_queries()
                     println("     ID: $id | Status: $status")
                 end
             end
+        else
+            println(not_run)
         end
         
-        # Query 3: Count iterations and success rate
         println("\n📊 Query 3: Iteration statistics...")
-        query3 = """
-        MATCH (i:DataMindIteration)
-        RETURN 
-            count(i) as total_iterations,
-            sum(case when i.success then 1 else 0 end) as successful_iterations,
-            avg(case when i.success then 1.0 else 0.0 end) as success_rate
-        """
-        
-        body3 = JSON3.write(Dict(
-            "statements" => [Dict(
-                "statement" => query3,
-                "parameters" => Dict()
-            )]
-        ))
-        
-        response3 = HTTP.post(endpoint, headers, body3)
-        result3 = JSON3.read(String(response3.body))
-        
-        if haskey(result3, "results") && !isempty(result3["results"])
-            data = result3["results"][1]["data"]
+        if length(results) >= 3
+            data = results[3]["data"]
             if !isempty(data)
                 total, successful, rate = data[1]["row"]
                 println("📈 Iteration Statistics:")
@@ -135,40 +133,39 @@ function test_direct_neo4j_queries()
                 println("   • Successful iterations: $successful")
                 println("   • Success rate: $(round(rate * 100, digits=1))%")
             end
+        else
+            println(not_run)
         end
         
-        # Query 4: Most common metrics
         println("\n📊 Query 4: Most common metrics...")
-        query4 = """
-        MATCH (i:DataMindIteration)
-        UNWIND keys(i.metrics) as metric_name
-        RETURN metric_name, count(*) as usage_count
-        ORDER BY usage_count DESC
-        LIMIT 5
-        """
-        
-        body4 = JSON3.write(Dict(
-            "statements" => [Dict(
-                "statement" => query4,
-                "parameters" => Dict()
-            )]
-        ))
-        
-        response4 = HTTP.post(endpoint, headers, body4)
-        result4 = JSON3.read(String(response4.body))
-        
-        if haskey(result4, "results") && !isempty(result4["results"])
-            data = result4["results"][1]["data"]
-            if !isempty(data)
+        if length(results) >= 4
+            metric_counts = Dict{String, Int}()
+            for row in results[4]["data"]
+                for metric in keys(JSON3.read(row["row"][1]))
+                    metric_counts[string(metric)] = get(metric_counts, string(metric), 0) + 1
+                end
+            end
+            if !isempty(metric_counts)
                 println("📊 Most Common Metrics:")
-                for row in data
-                    metric, count = row["row"]
+                for (metric, count) in first(sort(collect(metric_counts), by=last, rev=true), 5)
                     println("   • $metric: used $count times")
                 end
             end
+        else
+            println(not_run)
         end
         
-        println("\n🎉 Direct Neo4j query test completed successfully!")
+        # Report what Neo4j said went wrong
+        errors = haskey(result, "errors") ? result["errors"] : []
+        if !isempty(errors)
+            println("\n⚠️  Neo4j reported errors:")
+            for err in errors
+                println("   • $(err["code"]): $(err["message"])")
+            end
+            println("\n🎉 Direct Neo4j query test completed with query errors")
+        else
+            println("\n🎉 Direct Neo4j query test completed successfully!")
+        end
         return true
         
     catch e
@@ -0,0 +1,62 @@
+#!/usr/bin/env julia
+
+# Test Neo4j URI to HTTP API URL conversion
+
+using Pkg
+Pkg.activate(".")
+
+# Get the script directory and navigate to project root
+script_dir = dirname(@__FILE__)
+project_root = dirname(script_dir)
+cd(project_root)
+
+include(joinpath(project_root, "src", "DataMind.jl"))
+using .DataMind
+
+function test_neo4j_uri_conversion()
+    println("🧪 Testing Neo4j URI Conversion")
+    println("=" ^ 40)
+
+    cases = [
+        "bolt://localhost:7687" => "http://localhost:7474",
+        "neo4j://localhost:7687" => "http://localhost:7474",
+        "bolt://localhost" => "http://localhost:7474",
+        "bolt://db.example.com:7688" => "http://db.example.com:7688",
+        "bolt+s://db.example.com:7687" => "https://db.example.com:7473",
+        "neo4j+ssc://db.example.com" => "https://db.example.com:7473",
+        "bolt://[::1]:7687" => "http://[::1]:7474",
+        "http://localhost:7474" => "http://localhost:7474"
+    ]
+
+    passed = true
+    for (uri, expected) in cases
+        actual = DataMind.neo4j_http_uri(uri)
+        if actual == expected
+            println("✅ $uri → $actual")
+        else
+            println("❌ $uri → $actual (expected $expected)")
+            passed = false
+        end
+    end
+
+    try
+        DataMind.neo4j_http_uri("redis://localhost:6379")
+        println("❌ Unsupported scheme was accepted")
+        passed = false
+    catch e
+        if e isa ArgumentError
+            println("✅ Unsupported scheme rejected")
+        else
+            println("❌ Unsupported scheme raised $(typeof(e))")
+            passed = false
+        end
+    end
+
+    return passed
+end
+
+# Run the test
+if abspath(PROGRAM_FILE) == @__FILE__
+    success = test_neo4j_uri_conversion()
+    exit(success ? 0 : 1)
+end